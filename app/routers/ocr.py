@@ -1,5 +1,6 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status, Form
+from fastapi.responses import ORJSONResponse
 from app.clients.vision_client import get_vision_client, VisionClient
 from app.clients.gemini_client import get_gemini_client, GeminiClient
 from app.schemas.ocr import OCRResponse
@@ -81,6 +82,7 @@ async def upload_and_classify(
 @router.post(
     "/upload-and-classify-test",
     response_model=TaggedResponse,
+    response_class=ORJSONResponse,
     status_code=status.HTTP_200_OK
 )
 async def upload_and_classify_test(
@@ -117,4 +119,5 @@ async def upload_and_classify_test(
         limit=settings.ocr_concurrency,
     )
 
-    return TaggedResponse(results=list(results))
\ No newline at end of file
+    # 各要素は TaggedResult.from_llm で検証済みのため、TaggedResponse での再検証をせずに直接シリアライズ
+    return ORJSONResponse({"results": [r.to_dict() for r in results]})
\ No newline at end of file
@@ -1,5 +1,6 @@
+from dataclasses import dataclass
 from pydantic import BaseModel, Field
-from typing import List, Literal, Optional
+from typing import Any, List, Literal, Optional
 
 class ClassifyResponse(BaseModel):
     ocr_text: str
@@ -29,4 +30,68 @@ class TaggedItem(BaseModel):
     suggest_category_description: Optional[str] = None
 
 class TaggedResponse(BaseModel):
-    results: List[TaggedItem]
\ No newline at end of file
+    results: List[TaggedItem]
+
+def _str_field(item: dict, key: str) -> str:
+    v = item.get(key, "")
+    if isinstance(v, str):
+        return v
+    raise TypeError(f"{key}: expected str, got {type(v).__name__}")
+
+def _opt_str_field(item: dict, key: str) -> Optional[str]:
+    v = item.get(key, "")
+    if v is None or isinstance(v, str):
+        return v
+    raise TypeError(f"{key}: expected str or null, got {type(v).__name__}")
+
+@dataclass(slots=True)
+class TaggedResult:
+    """パイプライン内部用の軽量な結果。TaggedItem と同じ形で JSON 化する。"""
+    status_success: bool
+    category: str
+    title: str
+    location: str
+    description: str
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+    maps_url: Optional[str] = None
+    maps_display_name: Optional[str] = None
+    suggest_category_title: Optional[str] = None
+    suggest_category_description: Optional[str] = None
+
+    @classmethod
+    def from_llm(cls, item: dict, category: str, location: str, place: Optional[dict] = None) -> "TaggedResult":
+        """LLM出力の1件を検証して生成（検証はここで1回だけ）。不正な型は TypeError。"""
+        is_other = category == "その他"
+        return cls(
+            status_success=bool(item.get("status.success", False)),
+            category=category,
+            title=_str_field(item, "title"),
+            location=location,
+            description=_str_field(item, "description"),
+            lat=place["lat"] if place else None,
+            lng=place["lng"] if place else None,
+            maps_url=place["maps_url"] if place else None,
+            maps_display_name=place["maps_display_name"] if place else None,
+            suggest_category_title=_opt_str_field(item, "suggest_category_title") if is_other else "",
+            suggest_category_description=_opt_str_field(item, "suggest_category_description") if is_other else "",
+        )
+
+    @classmethod
+    def failure(cls, category: str, title: str, description: str) -> "TaggedResult":
+        return cls(status_success=False, category=category, title=title, location="", description=description)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "status.success": self.status_success,
+            "category": self.category,
+            "title": self.title,
+            "location": self.location,
+            "description": self.description,
+            "lat": self.lat,
+            "lng": self.lng,
+            "maps_url": self.maps_url,
+            "maps_display_name": self.maps_display_name,
+            "suggest_category_title": self.suggest_category_title,
+            "suggest_category_description": self.suggest_category_description,
+        }
@@ -1,67 +1,43 @@
 # app/services/batch_handler.py
 from fastapi import UploadFile
-from pydantic import ValidationError
 from typing import List
-import json
 
-from app.schemas.classify import TaggedItem
+from app.schemas.classify import TaggedResult
 from app.utils.validators import is_mime_allowed, read_limited
 from app.utils.threads import run_sync
 from app.core.config import settings
 from app.services.ocr_service import OCRService
 from app.services.classify_service import ClassifyService
 
+def _fail(candidate_categories: List[List[str]], title: str, description: str) -> TaggedResult:
+    category = candidate_categories[0][0] if candidate_categories else "location"
+    return TaggedResult.failure(category, title, description)
+
 async def handle_one_file(
     f: UploadFile,
     ocr: OCRService,
     classifier: ClassifyService,
     candidate_categories: List[List[str]],
-) -> TaggedItem:
+) -> TaggedResult:
     name = f.filename or "unnamed"
 
     if not is_mime_allowed(f.content_type):
-        return TaggedItem(**{
-            "status.success": False,
-            "category": candidate_categories[0][0] if candidate_categories else "location",
-            "title": name,
-            "location": "",
-            "description": f"Unsupported Media Type: {f.content_type}",
-        })
+        return _fail(candidate_categories, name, f"Unsupported Media Type: {f.content_type}")
 
     data = await read_limited(f)
     if not data:
-        return TaggedItem(**{
-            "status.success": False,
-            "category": candidate_categories[0][0] if candidate_categories else "location",
-            "title": name,
-            "location": "",
-            "description": f"File too large (> {settings.max_file_size_mb}MB) or empty",
-        })
+        return _fail(candidate_categories, name, f"File too large (> {settings.max_file_size_mb}MB) or empty")
 
+    text = None
     try:
         text = await run_sync(ocr.run_ocr_bytes, data)
-        payload = await run_sync(classifier.classify_json_with_categories, text, candidate_categories)
-
-        results = payload.get("results") if isinstance(payload, dict) else None
-        if not isinstance(results, list) or not results:
+        # 1ファイル1件なので先頭のみ検証させる（不要な要素の検証・Places検索を省く）
+        results = await run_sync(classifier.classify_json_with_categories, text, candidate_categories, max_results=1)
+        if not results:
             raise ValueError("results missing")
+        return results[0]
 
-        item = TaggedItem.model_validate(results[0])
-        return item
-
-    except (ValidationError, ValueError, TypeError) as e:
-        return TaggedItem(**{
-            "status.success": False,
-            "category": candidate_categories[0][0] if candidate_categories else "location",
-            "title": (text or name)[:30] if 'text' in locals() else name,
-            "location": "",
-            "description": f"Invalid LLM output: {str(e)}",
-        })
+    except (ValueError, TypeError) as e:
+        return _fail(candidate_categories, (text or name)[:30] if text is not None else name, f"Invalid LLM output: {str(e)}")
     except Exception as e:
-        return TaggedItem(**{
-            "status.success": False,
-            "category": candidate_categories[0][0] if candidate_categories else "location",
-            "title": name,
-            "location": "",
-            "description": f"Processing error: {str(e)}",
-        })
+        return _fail(candidate_categories, name, f"Processing error: {str(e)}")
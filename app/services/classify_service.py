@@ -1,9 +1,11 @@
 # app/services/classify_service.py
 import json, re, logging
+import orjson
 from string import Template
 import google.generativeai as genai
 from app.clients.gemini_client import GeminiClient
 from app.core.config import settings
+from app.schemas.classify import TaggedResult
 import requests
 
 DEFAULT_TAGS = [
@@ -70,7 +72,7 @@ def _strip_code_fence(s: str) -> str:
 def _extract_json_object(s: str) -> str | None:
     s2 = _strip_code_fence(s.strip())
     try:
-        json.loads(s2); return s2
+        orjson.loads(s2); return s2
     except Exception:
         pass
     start=-1; depth=0; in_str=False; esc=False
@@ -91,7 +93,7 @@ def _extract_json_object(s: str) -> str | None:
                     return s2[start:i+1]
     return None
 
-def _fallback_from_ocr(ocr_text: str, candidate_categories: list[list[str]]) -> dict:
+def _fallback_from_ocr(ocr_text: str, candidate_categories: list[list[str]]) -> list[TaggedResult]:
     t = (ocr_text or "").strip()
     # タイトル（OCRから抽出）
     title = ""
@@ -119,13 +121,13 @@ def _fallback_from_ocr(ocr_text: str, candidate_categories: list[list[str]]) ->
     lines=[l.strip() for l in t.splitlines() if l.strip()][:2]
     desc=(f"候補タグ: {category}。位置ヒント: {location}" if location else " / ".join(lines)[:120])
 
-    return {"results":[{
-        "status.success": False,
-        "category": category,
-        "title": title,
-        "location": location,
-        "description": desc
-    }]}
+    return [TaggedResult(
+        status_success=False,
+        category=category,
+        title=title,
+        location=location,
+        description=desc,
+    )]
 
 def get_place_from_title_location(title: str, location: str) -> dict[str, str | float] | None:
     try:
@@ -164,8 +166,14 @@ class ClassifyService:
             response_mime_type="application/json",
         )
 
-    def classify_json_with_categories(self, ocr_text: str, candidate_categories: list[list[str]] = DEFAULT_TAGS) -> dict:
-        """候補タグを使って厳密JSONで返す。失敗時も同スキーマでフォールバック。"""
+    def classify_json_with_categories(
+        self,
+        ocr_text: str,
+        candidate_categories: list[list[str]] = DEFAULT_TAGS,
+        max_results: int | None = None,
+    ) -> list[TaggedResult]:
+        """候補タグを使って厳密JSONを解釈し TaggedResult のリストで返す。失敗時はOCRからフォールバック。
+        max_results 指定時は先頭からその件数だけ検証・Places検索する。要素の型が不正な場合は TypeError を送出する。"""
         safe_ocr_text = (ocr_text or "").replace("$", "$$")
         categories_str = json.dumps(candidate_categories or DEFAULT_TAGS, ensure_ascii=False)
         prompt = PROMPT_TMPL.substitute(ocr_text=safe_ocr_text, candidate_categories=categories_str)
@@ -184,53 +192,32 @@ class ClassifyService:
 
         # JSONとして頑丈に解釈
         try:
-            payload = json.loads(_strip_code_fence(raw))
+            payload = orjson.loads(_strip_code_fence(raw))
         except Exception:
             block = _extract_json_object(raw)
             if not block:
                 return _fallback_from_ocr(ocr_text, candidate_categories or DEFAULT_TAGS)
             try:
-                payload = json.loads(block)
+                payload = orjson.loads(block)
             except Exception:
                 return _fallback_from_ocr(ocr_text, candidate_categories or DEFAULT_TAGS)
 
-        # 最終正規化
-        try:
-            results = payload.get("results")
-            if not isinstance(results, list) or not results or not isinstance(results[0], dict):
-                raise ValueError("results missing")
-            item = results[0]
-            
-            # タグのバリデーション
-            allowed_categories = {t[0] for t in (candidate_categories or DEFAULT_TAGS)}
+        # 最終正規化（各要素の検証は TaggedResult.from_llm で1回だけ行う）
+        results = payload.get("results") if isinstance(payload, dict) else None
+        if isinstance(results, list):
+            results = results[:max_results]
+        if not isinstance(results, list) or not results or not all(isinstance(r, dict) for r in results):
+            logging.warning("[Gemini] normalize failed: results missing")
+            return _fallback_from_ocr(ocr_text, candidate_categories or DEFAULT_TAGS)
+
+        allowed_categories = {t[0] for t in (candidate_categories or DEFAULT_TAGS)}
+        tagged: list[TaggedResult] = []
+        for item in results:
             category_val = str(item.get("category", "")).strip()
             if category_val not in allowed_categories:
                 category_val = "その他"
-                
-            categoryged_results = []
-            for item in results:
-                category_val = str(item.get("category", "")).strip()
-                if category_val not in allowed_categories:
-                    category_val = "その他"
-
-                location = str(item.get("location", "")).strip()
-                place_info = get_place_from_title_location(item.get("title", ""), location) if location else None
-
-                categoryged_results.append({
-                    "status.success": bool(item.get("status.success", False)),
-                    "category": category_val,
-                    "title": item.get("title", ""),
-                    "location": location,
-                    "description": item.get("description", ""),
-                    "lat": place_info["lat"] if place_info else None,
-                    "lng": place_info["lng"] if place_info else None,
-                    "maps_url": place_info["maps_url"] if place_info else None,
-                    "maps_display_name": place_info["maps_display_name"] if place_info else None,
-                    "suggest_category_title": item.get("suggest_category_title", "") if category_val == "その他" else "",
-                    "suggest_category_description": item.get("suggest_category_description", "") if category_val == "その他" else ""
-                })
-
-            return {"results": categoryged_results}
-        except Exception as e:
-            logging.warning("[Gemini] normalize failed: %s", e)
-            return _fallback_from_ocr(ocr_text, candidate_categories or DEFAULT_TAGS)
+
+            location = str(item.get("location", "")).strip()
+            place_info = get_place_from_title_location(item.get("title", ""), location) if location else None
+            tagged.append(TaggedResult.from_llm(item, category_val, location, place_info))
+        return tagged
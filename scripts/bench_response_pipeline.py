@@ -0,0 +1,103 @@
+# scripts/bench_response_pipeline.py
+"""
+/ocr/upload-and-classify-test の結果パイプライン（Gemini JSON → レスポンス bytes）のマイクロベンチマーク。
+OCR / Gemini / Places の外部呼び出しは含めず、1件あたりの CPU 時間とアロケーションを旧実装と比較する。
+
+    python -m scripts.bench_response_pipeline [--repeat 2000]
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+import orjson
+
+from app.schemas.classify import TaggedItem, TaggedResponse, TaggedResult
+
+BATCH_SIZES = [1, 4, 16]  # 16 = MAX_FILES
+ALLOWED = {"場所", "電車", "商品", "その他"}
+PLACE = {
+    "lat": 35.6812,
+    "lng": 139.7671,
+    "maps_url": "https://www.google.com/maps/place/?q=place_id:ChIJC3Cf2PuLGGAROO00ukl8JwA",
+    "maps_display_name": "東京駅",
+}
+RAW = json.dumps({"results": [{
+    "status.success": True,
+    "category": "場所",
+    "title": "カフェ・ド・パリ",
+    "location": "東京都千代田区丸の内1丁目",
+    "description": "駅直結のカフェ。営業時間 9:00-22:00。https://example.com/cafe",
+    "suggest_category_title": "",
+    "suggest_category_description": "",
+}]}, ensure_ascii=False)
+
+def before(raws: list[str]) -> bytes:
+    """旧実装: json.loads → 正規化dict → TaggedItem → TaggedResponse → JSON。"""
+    items = []
+    for raw in raws:
+        payload = json.loads(raw)
+        item = payload["results"][0]
+        category_val = str(item.get("category", "")).strip()
+        if category_val not in ALLOWED:
+            category_val = "その他"
+        normalized = {
+            "status.success": bool(item.get("status.success", False)),
+            "category": category_val,
+            "title": item.get("title", ""),
+            "location": str(item.get("location", "")).strip(),
+            "description": item.get("description", ""),
+            "lat": PLACE["lat"],
+            "lng": PLACE["lng"],
+            "maps_url": PLACE["maps_url"],
+            "maps_display_name": PLACE["maps_display_name"],
+            "suggest_category_title": item.get("suggest_category_title", "") if category_val == "その他" else "",
+            "suggest_category_description": item.get("suggest_category_description", "") if category_val == "その他" else "",
+        }
+        items.append(TaggedItem.model_validate(normalized))
+    # response_model=TaggedResponse による再検証とシリアライズ
+    resp = TaggedResponse.model_validate(TaggedResponse(results=items).model_dump(by_alias=True))
+    return json.dumps(resp.model_dump(by_alias=True), ensure_ascii=False).encode("utf-8")
+
+def after(raws: list[str]) -> bytes:
+    """新実装: orjson.loads → TaggedResult（検証1回）→ orjson。"""
+    results = []
+    for raw in raws:
+        item = orjson.loads(raw)["results"][0]
+        category_val = str(item.get("category", "")).strip()
+        if category_val not in ALLOWED:
+            category_val = "その他"
+        location = str(item.get("location", "")).strip()
+        results.append(TaggedResult.from_llm(item, category_val, location, PLACE))
+    return orjson.dumps({"results": [r.to_dict() for r in results]})
+
+def measure(fn, raws: list[str], repeat: int) -> tuple[float, float]:
+    """(CPU µs/件, ピーク割り当て KB/件) を返す。"""
+    fn(raws)  # warm-up
+    t0 = time.process_time()
+    for _ in range(repeat):
+        fn(raws)
+    cpu_us = (time.process_time() - t0) / (repeat * len(raws)) * 1e6
+
+    tracemalloc.start()
+    fn(raws)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu_us, peak / 1024 / len(raws)
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    assert orjson.loads(before([RAW])) == orjson.loads(after([RAW])), "出力が一致しない"
+
+    print(f"{'batch':>5} {'impl':>6} {'cpu µs/item':>12} {'peak KB/item':>13}")
+    for n in BATCH_SIZES:
+        raws = [RAW] * n
+        for name, fn in (("before", before), ("after", after)):
+            cpu_us, peak_kb = measure(fn, raws, args.repeat)
+            print(f"{n:>5} {name:>6} {cpu_us:>12.2f} {peak_kb:>13.2f}")
+
+if __name__ == "__main__":
+    main()